@@ -1 +0,0 @@
-print("gui pack imported")
\ No newline at end of file
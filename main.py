@@ -1,24 +1,16 @@
-
 """
-Main entry point for the YOLOv5 Detector application.
-This script initializes and runs the application.
+Launcher for running the application from a checkout (python main.py).
+Installed users get the yolov5-detector console script instead.
 """
-import sys
 import os
+import sys
 
-# Add project root to sys.path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.append(os.path.dirname(current_dir))
-print(f'sys.path = {sys.path}')
+# Running uninstalled: make the src/ package importable
+_src = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src')
+if _src not in sys.path:
+    sys.path.insert(0, _src)
 
-from PyQt6.QtWidgets import QApplication
-from gui.main_windows import MainWindow
-def main():
-    """Initialize and run the application."""
-    app = QApplication(sys.argv)
-    window = MainWindow()
-    window.show()
-    sys.exit(app.exec())
+from yolov5_pyqt6.main import main
 
 if __name__ == '__main__':
-    main()
\ No newline at end of file
+    main()
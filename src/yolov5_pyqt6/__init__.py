@@ -0,0 +1 @@
+"""YOLOv5 object detection GUI built with PyQt6."""
@@ -0,0 +1 @@
+"""Configuration package for the YOLOv5 Detector application."""
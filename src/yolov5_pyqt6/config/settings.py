@@ -2,15 +2,72 @@
 Configuration settings for the YOLOv5 Detector application.
 Contains default values and argument parsing functionality.
 """
-import argparse
+from dataclasses import dataclass
+
+@dataclass
+class DetectionOptions:
+    """
+    Default configuration for the detector and GUI.
+
+    Field names match the attributes YOLODetector and MainWindow read.
+    Constructing this is O(microseconds), unlike building a 25-argument
+    ArgumentParser on every window open; argparse is kept in
+    parse_cli_args() for actual command-line runs.
+    """
+    weights: str = 'weights/yolov5s.pt'
+    source: str = 'data/images'
+    data: str = 'data/coco128.yaml'
+    img_size: int = 640
+    conf_thres: float = 0.25
+    iou_thres: float = 0.45
+    max_det: int = 1000
+    batch_size: int = 1
+    compile: bool = False
+    int8: bool = False
+    calib_dir: str = ''
+    fp16: bool = True
+    save_preview: bool = False
+    device: str = ''
+    view_img: bool = False
+    save_txt: bool = False
+    save_conf: bool = False
+    save_crop: bool = False
+    nosave: bool = False
+    classes: list = None
+    agnostic_nms: bool = False
+    augment: bool = False
+    visualize: bool = False
+    update: bool = False
+    project: str = 'runs/detect'
+    name: str = 'exp'
+    exist_ok: bool = False
+    line_thickness: int = 3
+    hide_labels: bool = False
+    hide_conf: bool = False
 
 def get_default_args():
     """
-    Define and return the default configuration arguments.
-    
+    Return the default configuration arguments.
+
+    Returns:
+        DetectionOptions: Default arguments
+    """
+    return DetectionOptions()
+
+def parse_cli_args(argv=None):
+    """
+    Parse configuration arguments from the command line.
+
+    Only used for CLI runs; the GUI constructs DetectionOptions directly.
+
+    Args:
+        argv (list, optional): Argument list. Defaults to sys.argv.
+
     Returns:
-        argparse.Namespace: Default arguments
+        argparse.Namespace: Parsed arguments
     """
+    import argparse
+
     parser = argparse.ArgumentParser(description='YOLOv5 Object Detection')
     parser.add_argument('--weights', nargs='+', type=str, default='weights/yolov5s.pt',
                         help='model path(s)')
@@ -26,6 +83,18 @@ def get_default_args():
                         help='NMS IoU threshold')
     parser.add_argument('--max-det', type=int, default=1000,
                         help='maximum detections per image')
+    parser.add_argument('--batch-size', type=int, default=1,
+                        help='frames per inference batch for video files')
+    parser.add_argument('--compile', action='store_true',
+                        help='compile the model with torch.compile/TorchScript')
+    parser.add_argument('--int8', action='store_true',
+                        help='use an INT8-quantized ONNX model on CPU')
+    parser.add_argument('--calib-dir', type=str, default='',
+                        help='calibration image directory for INT8 quantization')
+    parser.add_argument('--no-fp16', dest='fp16', action='store_false',
+                        help='disable FP16 inference on GPU')
+    parser.add_argument('--save-preview', action='store_true',
+                        help='save annotated image results to prediction.jpg')
     parser.add_argument('--device', default='',
                         help='cuda device, i.e. 0 or 0,1,2,3 or cpu')
     parser.add_argument('--view-img', action='store_true',
@@ -60,9 +129,9 @@ def get_default_args():
                         help='hide labels')
     parser.add_argument('--hide-conf', default=False, action='store_true',
                         help='hide confidences')
-    
-    return parser.parse_args([])  # Parse with empty list to get defaults
+
+    return parser.parse_args(argv)
 
 # Application constants
 APP_NAME = "YOLO Detector"
-APP_VERSION = "1.0"
\ No newline at end of file
+APP_VERSION = "1.0"
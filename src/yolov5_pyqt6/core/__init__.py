@@ -0,0 +1 @@
+"""Core detection package for the YOLOv5 Detector application."""
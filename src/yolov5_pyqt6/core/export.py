@@ -0,0 +1,150 @@
+"""
+Offline export utilities for the YOLOv5 Detector application.
+Converts .pt checkpoints to ONNX and builds TensorRT engines that
+core.detector.YOLODetector can load directly.
+"""
+import glob
+import os
+import subprocess
+
+import cv2
+import numpy as np
+import torch
+from models.experimental import attempt_load
+from utils.augmentations import letterbox
+
+def export_onnx(weights, onnx_path=None, img_size=640):
+    """
+    Export a YOLOv5 .pt checkpoint to ONNX.
+
+    Args:
+        weights (str): Path to .pt weights file
+        onnx_path (str, optional): Output path. Defaults to weights with .onnx suffix.
+        img_size (int, optional): Inference image size. Defaults to 640.
+
+    Returns:
+        str: Path to the exported ONNX model
+    """
+    if onnx_path is None:
+        onnx_path = os.path.splitext(weights)[0] + '.onnx'
+
+    model = attempt_load(weights=weights, device='cpu', inplace=True, fuse=True)
+    model.eval()
+
+    # Detect's eval forward returns (cat(z, 1), x) — the prediction plus
+    # the three raw feature maps. Export mode prunes the traced graph to
+    # the single prediction tensor so the engine gets exactly one output
+    # binding, matching what the detector's TensorRT backend reads back.
+    for m in model.modules():
+        if m.__class__.__name__ == 'Detect':
+            m.export = True
+
+    dummy = torch.zeros(1, 3, img_size, img_size)
+    torch.onnx.export(
+        model, dummy, onnx_path,
+        opset_version=12,
+        input_names=['images'],
+        output_names=['output'],
+    )
+    return onnx_path
+
+def build_engine(onnx_path, engine_path=None, fp16=True, int8=False, calib_cache=None):
+    """
+    Build a TensorRT engine from an ONNX model using trtexec.
+
+    Args:
+        onnx_path (str): Path to ONNX model
+        engine_path (str, optional): Output path. Defaults to onnx with .engine suffix.
+        fp16 (bool, optional): Enable FP16 precision. Defaults to True.
+        int8 (bool, optional): Enable INT8 precision. Defaults to False.
+        calib_cache (str, optional): TensorRT INT8 calibration cache (the
+            scale file written by a previous calibration run). Without
+            one, trtexec assigns placeholder dynamic ranges — fine for
+            perf measurement, useless for accuracy.
+
+    Returns:
+        str: Path to the built engine
+    """
+    if engine_path is None:
+        engine_path = os.path.splitext(onnx_path)[0] + '.engine'
+
+    cmd = ['trtexec', f'--onnx={onnx_path}', f'--saveEngine={engine_path}']
+    if fp16:
+        cmd.append('--fp16')
+    if int8:
+        cmd.append('--int8')
+        if calib_cache:
+            cmd.append(f'--calib={calib_cache}')
+
+    subprocess.run(cmd, check=True)
+    return engine_path
+
+def quantize_onnx(onnx_in, onnx_out=None, calib_dir=None, img_size=640,
+                  max_images=200):
+    """
+    Post-training static INT8 quantization of an ONNX model.
+
+    Produces a QDQ-format model so ONNX Runtime's CPU provider runs the
+    conv/matmul layers with int8 dot-product instructions (VNNI where
+    available). Activations are calibrated over letterboxed images from
+    calib_dir.
+
+    Args:
+        onnx_in (str): Path to the FP32 ONNX model
+        onnx_out (str, optional): Output path. Defaults to *_int8.onnx.
+        calib_dir (str): Directory of calibration images
+        img_size (int, optional): Inference image size. Defaults to 640.
+        max_images (int, optional): Calibration set size. Defaults to 200.
+
+    Returns:
+        str: Path to the quantized model
+    """
+    from onnxruntime.quantization import (CalibrationDataReader, QuantFormat,
+                                          QuantType, quantize_static)
+
+    if onnx_out is None:
+        onnx_out = os.path.splitext(onnx_in)[0] + '_int8.onnx'
+
+    class _ImageReader(CalibrationDataReader):
+        """Feeds letterboxed calibration images to the quantizer."""
+
+        def __init__(self, paths):
+            self._iter = iter(paths)
+
+        def get_next(self):
+            for path in self._iter:
+                img = cv2.imread(path)
+                if img is None:
+                    continue
+                img = letterbox(img, new_shape=img_size)[0]
+                img = img[:, :, ::-1].transpose(2, 0, 1)
+                img = np.ascontiguousarray(img, dtype=np.float32) / 255.0
+                return {'images': img[None]}
+            return None
+
+    paths = sorted(glob.glob(os.path.join(calib_dir, '*')))[:max_images]
+    quantize_static(
+        onnx_in, onnx_out,
+        calibration_data_reader=_ImageReader(paths),
+        quant_format=QuantFormat.QDQ,
+        activation_type=QuantType.QInt8,
+    )
+    return onnx_out
+
+def export_engine(weights, img_size=640, fp16=True, int8=False, calib_cache=None):
+    """
+    Full .pt -> ONNX -> TensorRT engine pipeline.
+
+    Args:
+        weights (str): Path to .pt weights file
+        img_size (int, optional): Inference image size. Defaults to 640.
+        fp16 (bool, optional): Enable FP16 precision. Defaults to True.
+        int8 (bool, optional): Enable INT8 precision. Defaults to False.
+        calib_cache (str, optional): TensorRT INT8 calibration cache from
+                                     a previous calibration run
+
+    Returns:
+        str: Path to the built engine
+    """
+    onnx_path = export_onnx(weights, img_size=img_size)
+    return build_engine(onnx_path, fp16=fp16, int8=int8, calib_cache=calib_cache)
@@ -0,0 +1,293 @@
+"""
+Utility functions for the YOLOv5 Detector application.
+"""
+import os
+import queue
+import subprocess
+import threading
+import cv2
+import numpy as np
+from PyQt6.QtGui import QImage
+
+def probe_rotation(cap, frame=None):
+    """
+    Determine the rotation correction for a capture stream.
+
+    Prefers the container's orientation metadata; falls back to a
+    portrait-shape heuristic, using the first decoded frame when given
+    and the capture's reported dimensions otherwise. Shared by the
+    video worker (which applies the rotation) and create_video_writer
+    (which must open the writer with the post-rotation dimensions).
+
+    Args:
+        cap (cv2.VideoCapture): Opened capture source
+        frame (numpy.ndarray, optional): First decoded frame
+
+    Returns:
+        int or None: cv2.ROTATE_* constant, or None for no rotation
+    """
+    try:
+        meta = int(cap.get(cv2.CAP_PROP_ORIENTATION_META))
+    except (AttributeError, cv2.error):
+        meta = 0
+
+    codes = {90: cv2.ROTATE_90_COUNTERCLOCKWISE,
+             180: cv2.ROTATE_180,
+             270: cv2.ROTATE_90_CLOCKWISE}
+    if meta in codes:
+        return codes[meta]
+
+    # 如果高大于宽，可能需要旋转（逆时针90度修正向右旋转）
+    if frame is not None:
+        height, width = frame.shape[:2]
+    else:
+        width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+        height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    if height > width:
+        return cv2.ROTATE_90_COUNTERCLOCKWISE
+    return None
+
+def load_image(path, device=None):
+    """
+    Read an image from disk for detection.
+
+    Decodes via np.fromfile + cv2.imdecode, which handles non-ASCII
+    paths that cv2.imread mishandles on Windows. For JPEG files with a
+    CUDA device, decoding is done on the GPU through torchvision/nvjpeg
+    and a CHW RGB uint8 tensor is returned instead, skipping both the
+    CPU decode and the upload of the decoded pixel buffer.
+
+    Args:
+        path (str): Image file path
+        device (torch.device, optional): Device for GPU JPEG decoding
+
+    Returns:
+        numpy.ndarray or torch.Tensor: BGR image array, or CHW RGB uint8
+                                       CUDA tensor when decoded on GPU.
+                                       None if the file cannot be decoded.
+    """
+    if device is not None and getattr(device, 'type', 'cpu') == 'cuda' \
+            and path.lower().endswith(('.jpg', '.jpeg')):
+        try:
+            from torchvision.io import ImageReadMode, decode_jpeg, read_file
+            return decode_jpeg(read_file(path), mode=ImageReadMode.RGB,
+                               device=device)
+        except Exception as e:
+            print(f"GPU JPEG decode unavailable: {str(e)}")
+
+    data = np.fromfile(path, dtype=np.uint8)
+    return cv2.imdecode(data, cv2.IMREAD_COLOR)
+
+def cv_to_qt_image(cv_img):
+    """
+    Wrap an OpenCV BGR image in a QImage without copying.
+
+    Qt 6 understands BGR natively (Format_BGR888), so no cvtColor and
+    no resize happen here; scaling to the display is done once on the
+    pixmap by the caller. The caller must keep cv_img alive for as long
+    as the QImage references its memory.
+
+    Args:
+        cv_img (numpy.ndarray): OpenCV image (BGR format)
+
+    Returns:
+        QImage: Qt image viewing the numpy array's pixel buffer
+    """
+    height, width = cv_img.shape[:2]
+    return QImage(cv_img.data, width, height, cv_img.strides[0],
+                  QImage.Format.Format_BGR888)
+
+def imwrite_async(path, img):
+    """
+    Write an image to disk on a background thread.
+
+    cv2.imwrite blocks for JPEG encode plus disk I/O; callers on the
+    GUI thread should not wait for either.
+
+    Args:
+        path (str): Output file path
+        img (numpy.ndarray): Image to save (BGR format)
+    """
+    threading.Thread(target=cv2.imwrite, args=(path, img),
+                     daemon=True).start()
+
+class AsyncWriter:
+    """
+    Background wrapper around a video writer.
+
+    write() only enqueues the frame; a dedicated thread feeds the
+    wrapped writer, so encoding and disk I/O overlap with detection
+    instead of serializing with it. The bounded queue applies
+    backpressure if encoding cannot keep up. When out_size is given,
+    frames are downscaled on the writer thread before encoding, so
+    callers keep handing in full-resolution frames.
+    """
+
+    def __init__(self, writer, queue_size=64, out_size=None):
+        """
+        Start the writer thread.
+
+        Args:
+            writer: cv2.VideoWriter-compatible writer to wrap
+            queue_size (int, optional): Pending frame bound. Defaults to 64.
+            out_size (tuple, optional): (width, height) to resize frames
+                                        to before encoding. Defaults to None.
+        """
+        self._writer = writer
+        self._out_size = out_size
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._thread = threading.Thread(target=self._worker, daemon=True)
+        self._thread.start()
+
+    def _worker(self):
+        """Drain the queue into the wrapped writer until the sentinel."""
+        while True:
+            frame = self._queue.get()
+            if frame is None:
+                break
+            try:
+                if self._out_size is not None and \
+                        (frame.shape[1], frame.shape[0]) != self._out_size:
+                    frame = cv2.resize(frame, self._out_size,
+                                       interpolation=cv2.INTER_AREA)
+                self._writer.write(frame)
+            except Exception as e:
+                print(f"Video write failed: {str(e)}")
+
+    def write(self, frame):
+        """Queue one BGR frame for encoding."""
+        self._queue.put(frame)
+
+    def release(self):
+        """Flush pending frames and close the wrapped writer."""
+        self._queue.put(None)
+        self._thread.join()
+        self._writer.release()
+
+_ffmpeg_codec = None  # Cached probe result: best available H.264 encoder
+
+def _probe_ffmpeg_codec():
+    """
+    Find the best H.264 encoder exposed by the system ffmpeg.
+
+    Returns:
+        str: Encoder name ('h264_nvenc' or 'libx264'), or None if
+             ffmpeg is not available
+    """
+    global _ffmpeg_codec
+    if _ffmpeg_codec is None:
+        try:
+            result = subprocess.run(
+                ['ffmpeg', '-hide_banner', '-encoders'],
+                capture_output=True, text=True, timeout=10)
+            if 'h264_nvenc' in result.stdout:
+                _ffmpeg_codec = 'h264_nvenc'
+            elif 'libx264' in result.stdout:
+                _ffmpeg_codec = 'libx264'
+            else:
+                _ffmpeg_codec = ''
+        except (OSError, subprocess.SubprocessError):
+            _ffmpeg_codec = ''
+    return _ffmpeg_codec or None
+
+class FFmpegWriter:
+    """
+    cv2.VideoWriter-compatible wrapper around an FFmpeg subprocess.
+
+    Pipes raw BGR frames to ffmpeg for H.264 encoding — hardware NVENC
+    when available — so encoding leaves the Python process and the
+    output is ~10x smaller than MJPG.
+    """
+
+    def __init__(self, output_path, fps, size, codec):
+        """
+        Start the encoder process.
+
+        Args:
+            output_path (str): Output video path
+            fps (float): Output frame rate
+            size (tuple): (width, height) of incoming frames
+            codec (str): FFmpeg encoder name, e.g. 'h264_nvenc'
+        """
+        cmd = [
+            'ffmpeg', '-y', '-f', 'rawvideo', '-pix_fmt', 'bgr24',
+            '-s', f'{size[0]}x{size[1]}', '-r', str(fps), '-i', '-',
+            '-c:v', codec, '-pix_fmt', 'yuv420p', output_path,
+        ]
+        self._proc = subprocess.Popen(
+            cmd, stdin=subprocess.PIPE,
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+    def write(self, frame):
+        """Encode one BGR frame."""
+        self._proc.stdin.write(frame.tobytes())
+
+    def release(self):
+        """Flush and close the encoder process."""
+        if self._proc.stdin:
+            self._proc.stdin.close()
+        self._proc.wait()
+
+def create_video_writer(cap, output_path='prediction.avi'):
+    """
+    Create a video writer based on input video properties.
+
+    Prefers H.264 in an .mp4 container (OpenCV 'avc1', then FFmpeg with
+    NVENC when present); MJPG/.avi is kept only as the last resort since
+    it writes roughly 10x the bytes and bottlenecks on disk I/O. The
+    chosen writer is wrapped in AsyncWriter so write() never blocks the
+    caller on encoding. Sources of 1080p and above are written at half
+    resolution (e.g. 960x540 for 1080p): for a preview recording the
+    extra pixels only cost encode time that competes with detection.
+
+    Args:
+        cap (cv2.VideoCapture): Video capture object
+        output_path (str, optional): Output video path. Defaults to 'prediction.avi'.
+
+    Returns:
+        AsyncWriter: Background writer feeding the chosen encoder
+    """
+    width = int(cap.get(cv2.CAP_PROP_FRAME_WIDTH))
+    height = int(cap.get(cv2.CAP_PROP_FRAME_HEIGHT))
+    fps = cap.get(cv2.CAP_PROP_FPS)
+
+    # Default to 20 fps if unable to determine
+    if fps <= 0:
+        fps = 20
+
+    # The worker rotates portrait streams upright before frames reach
+    # the writer, so open with the post-rotation dimensions
+    rotate = probe_rotation(cap)
+    if rotate in (cv2.ROTATE_90_CLOCKWISE, cv2.ROTATE_90_COUNTERCLOCKWISE):
+        width, height = height, width
+
+    # Halve the encoded resolution for HD sources; dimensions kept
+    # even for yuv420p
+    out_size = None
+    if height >= 1080:
+        width, height = (width // 2) & ~1, (height // 2) & ~1
+        out_size = (width, height)
+
+    # Try OpenCV's own H.264 support first
+    mp4_path = os.path.splitext(output_path)[0] + '.mp4'
+    writer = cv2.VideoWriter(
+        mp4_path, cv2.VideoWriter_fourcc(*'avc1'), fps, (width, height))
+    if writer.isOpened():
+        return AsyncWriter(writer, out_size=out_size)
+    writer.release()
+
+    # Fall back to piping frames to ffmpeg (NVENC if available)
+    codec = _probe_ffmpeg_codec()
+    if codec:
+        try:
+            return AsyncWriter(
+                FFmpegWriter(mp4_path, fps, (width, height), codec),
+                out_size=out_size)
+        except OSError as e:
+            print(f"FFmpeg writer unavailable: {str(e)}")
+
+    # Last resort: MJPG in .avi
+    fourcc = cv2.VideoWriter_fourcc(*'MJPG')
+    writer = cv2.VideoWriter(output_path, fourcc, fps, (width, height))
+
+    return AsyncWriter(writer, out_size=out_size)
\ No newline at end of file
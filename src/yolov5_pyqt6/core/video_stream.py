@@ -0,0 +1,113 @@
+"""
+Threaded video capture for the YOLOv5 Detector application.
+Decodes frames ahead of the consumer so detection never blocks on
+cv2.VideoCapture.read().
+"""
+import queue
+import threading
+
+class FileVideoStream:
+    """
+    Prefetching wrapper around an opened cv2.VideoCapture.
+
+    A daemon thread loops cap.read() and pushes frames into a bounded
+    queue, so frame decoding runs in parallel with detection instead of
+    serializing with it. The queue bound keeps a slow consumer from
+    backing frames up in RAM; live sources should use a small bound so
+    displayed frames stay current.
+    """
+
+    def __init__(self, cap, queue_size=128):
+        """
+        Initialize the stream.
+
+        Args:
+            cap (cv2.VideoCapture): Opened capture source
+            queue_size (int, optional): Prefetch queue bound. Defaults to 128.
+        """
+        self.cap = cap
+        self._queue = queue.Queue(maxsize=queue_size)
+        self._stopped = threading.Event()
+        self._release_on_exit = threading.Event()
+        self._thread = None
+
+    def start(self):
+        """
+        Start the prefetch thread.
+
+        Returns:
+            FileVideoStream: self, for chaining
+        """
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._reader, daemon=True)
+        self._thread.start()
+        return self
+
+    def _reader(self):
+        """Decode loop: fill the queue until end of stream or stop()."""
+        while not self._stopped.is_set():
+            ret, frame = self.cap.read()
+            if not ret or frame is None:
+                break
+            while not self._stopped.is_set():
+                try:
+                    self._queue.put(frame, timeout=0.1)
+                    break
+                except queue.Full:
+                    continue
+
+        # Sentinel marks end of stream for the consumer
+        try:
+            self._queue.put(None, timeout=1.0)
+        except queue.Full:
+            pass
+
+        # Deferred release: stop() gave up joining while this thread
+        # was still blocked in cap.read()
+        if self._release_on_exit.is_set():
+            self.cap.release()
+
+    def read(self, timeout=5.0):
+        """
+        Return the next decoded frame.
+
+        Args:
+            timeout (float, optional): Seconds to wait. Defaults to 5.0.
+
+        Returns:
+            numpy.ndarray: Next frame, or None at end of stream/timeout
+        """
+        try:
+            return self._queue.get(timeout=timeout)
+        except queue.Empty:
+            return None
+
+    def stop(self, release=False):
+        """
+        Stop the prefetch thread.
+
+        cv2.VideoCapture is not thread-safe: releasing a capture while
+        the reader is still blocked in cap.read() (stalled camera,
+        unplugged device) can crash. With release=True the capture is
+        released only once the reader has provably exited — here after
+        a successful join, or by the reader thread itself if the join
+        times out while it is still blocked.
+
+        Args:
+            release (bool, optional): Also release the capture once the
+                                      reader has exited. Defaults to False.
+        """
+        if release:
+            self._release_on_exit.set()
+        self._stopped.set()
+
+        if self._thread is not None:
+            self._thread.join(timeout=1.0)
+            if self._thread.is_alive():
+                # Still blocked in cap.read(); the reader releases the
+                # capture itself when the read returns
+                return
+            self._thread = None
+
+        if self._release_on_exit.is_set():
+            self.cap.release()
@@ -0,0 +1 @@
+"""GUI package for the YOLOv5 Detector application."""
@@ -2,52 +2,85 @@
 Main window implementation for the YOLOv5 Detector application.
 """
 import os
+from collections import Counter
 import cv2
+import numpy as np
 from PyQt6 import QtCore, QtWidgets, QtGui
 from PyQt6.QtWidgets import QMainWindow, QFileDialog, QMessageBox
-from PyQt6.QtCore import QTimer
-from PyQt6.QtGui import QImage, QPixmap
 
-# Import project modules
-import sys
-import os
-import time
-# Add parent directory to path
-current_dir = os.path.dirname(os.path.abspath(__file__))
-parent_dir = os.path.dirname(current_dir)
-sys.path.append(parent_dir)
+from yolov5_pyqt6.config.settings import get_default_args
+from yolov5_pyqt6.core.detector import YOLODetector
+from yolov5_pyqt6.core.utils import create_video_writer, cv_to_qt_image, imwrite_async, load_image
+from yolov5_pyqt6.gui.ui_components import ControlPanel, DisplayPanel
+from yolov5_pyqt6.gui.toast import Toast
+from yolov5_pyqt6.gui.video_worker import VideoWorker
+from yolov5_pyqt6.gui.styles import get_image_type_filter, get_video_type_filter, get_weights_type_filter
+
+
+class ExportThread(QtCore.QThread):
+    """
+    One-shot thread running the TensorRT engine export.
+
+    export_engine traces the model to ONNX and shells out to trtexec,
+    which can take minutes; running it here keeps the event loop
+    responsive while the engine builds.
+    """
 
-from config.settings import get_default_args
-from core.detector import YOLODetector
-from core.utils import cv_to_qt_image, create_video_writer
-from gui.ui_components import ControlPanel, DisplayPanel
-from gui.styles import MAIN_STYLE, get_image_type_filter, get_video_type_filter, get_weights_type_filter
+    succeeded = QtCore.pyqtSignal(str)
+    failed = QtCore.pyqtSignal(str)
+
+    def __init__(self, weights, img_size, parent=None):
+        """
+        Initialize the export thread.
+
+        Args:
+            weights (str): Path to the .pt weights file
+            img_size (int): Inference image size for the export
+            parent (QObject, optional): Qt parent. Defaults to None.
+        """
+        super().__init__(parent)
+        self._weights = weights
+        self._img_size = img_size
+
+    def run(self):
+        """Build the engine and report the outcome via signals."""
+        try:
+            from yolov5_pyqt6.core.export import export_engine
+            engine_path = export_engine(self._weights, img_size=self._img_size)
+        except Exception as e:
+            self.failed.emit(str(e))
+        else:
+            self.succeeded.emit(engine_path)
 
 
 class MainWindow(QMainWindow):
     """Main application window"""
-    
+
     def __init__(self):
         """Initialize the main window"""
         super().__init__()
-        
+
         # Setup instance variables
         self.opt = get_default_args()
         self.detector = YOLODetector(self.opt)
         self.cap = cv2.VideoCapture()
         self.out = None
-        self.timer_video = QTimer()
         self.play_state = True  # True for playing, False for paused
         self.weights_path = None
-        
+
+        # Background detection worker and its thread
+        self.video_worker = None
+        self.video_thread = None
+
+        # Background engine export thread
+        self._export_thread = None
+
+        # Keeps the zero-copy QImage's memory alive while displayed
+        self._frame_ref = None
+
         # Setup UI
         self.setup_ui()
         self.init_signals()
-        
-        # FPS计算相关变量
-        self.fps = 0.0
-        self.fps_last_time = time.time()
-        self.frame_count = 0
 
         # Set window properties
         self.setWindowTitle("YOLO Object Detector")
@@ -55,9 +88,8 @@ class MainWindow(QMainWindow):
     
     def setup_ui(self):
         """Set up the user interface"""
-        # Apply stylesheet
-        self.setStyleSheet(MAIN_STYLE)
-        
+        # Styling comes from the application-level stylesheet (main.py)
+
         # Central widget and main layout
         self.central_widget = QtWidgets.QWidget(parent=self)
         self.central_widget.setObjectName("centralWidget")
@@ -78,6 +110,13 @@ class MainWindow(QMainWindow):
         main_layout.addWidget(self.control_panel)
         main_layout.addWidget(self.display_panel, 1)  # Display panel gets more space
         
+        # Frames are scaled once on the pixmap (fast transform, aspect
+        # kept), not again by the label
+        self.display_panel.display_label.setScaledContents(False)
+
+        # Non-modal notification overlay
+        self.toast = Toast(self.central_widget)
+
         # Create menu bar
         self.create_menu_bar()
         
@@ -92,7 +131,11 @@ class MainWindow(QMainWindow):
         open_action = QtGui.QAction("Open Weights", self)
         open_action.triggered.connect(self.select_weights)
         file_menu.addAction(open_action)
-        
+
+        self.export_action = QtGui.QAction("Export to TensorRT", self)
+        self.export_action.triggered.connect(self.export_tensorrt)
+        file_menu.addAction(self.export_action)
+
         exit_action = QtGui.QAction("Exit", self)
         exit_action.triggered.connect(self.close)
         file_menu.addAction(exit_action)
@@ -114,10 +157,28 @@ class MainWindow(QMainWindow):
         self.control_panel.button_camera.clicked.connect(self.toggle_camera)
         self.control_panel.button_stop.clicked.connect(self.toggle_pause)
         self.control_panel.button_finish.clicked.connect(self.stop_detection)
-        
-        # Connect video timer
-        self.timer_video.timeout.connect(self.process_video_frame)
+
+        # Batch size selection
+        self.control_panel.batch_combo.currentTextChanged.connect(
+            self.set_batch_size)
+
+        # FP16 toggle (applied on the next model initialization)
+        self.control_panel.fp16_checkbox.toggled.connect(self.set_fp16)
     
+    def _notify(self, text):
+        """
+        Show non-blocking feedback for warnings and errors.
+
+        Unlike a modal QMessageBox, this never stalls the event loop,
+        so worker frame signals and repaints continue while the
+        message is visible.
+
+        Args:
+            text (str): Message to display
+        """
+        self.statusBar().showMessage(text, 3000)
+        self.toast.show_message(text)
+
     def select_weights(self):
         """Open file dialog to select model weights"""
         weights_path, _ = QFileDialog.getOpenFileName(
@@ -133,6 +194,54 @@ class MainWindow(QMainWindow):
         else:
             self.display_panel.status_display.setText("No weights file selected")
     
+    def export_tensorrt(self):
+        """Export the selected .pt weights to a TensorRT engine"""
+        weights = self.weights_path if self.weights_path else self.opt.weights
+        weights = weights[0] if isinstance(weights, (list, tuple)) else weights
+
+        if not str(weights).endswith('.pt'):
+            self._notify("Select a .pt weights file to export")
+            return
+
+        if self._export_thread is not None and self._export_thread.isRunning():
+            self._notify("An engine export is already running")
+            return
+
+        # Build on a background thread — trtexec can take minutes and
+        # must not freeze the event loop
+        self.statusBar().showMessage("Exporting TensorRT engine (may take minutes)...")
+        self.export_action.setEnabled(False)
+
+        self._export_thread = ExportThread(str(weights), self.opt.img_size, self)
+        self._export_thread.succeeded.connect(self._on_export_done)
+        self._export_thread.failed.connect(self._on_export_failed)
+        self._export_thread.finished.connect(
+            lambda: self.export_action.setEnabled(True))
+        self._export_thread.start()
+
+    def _on_export_done(self, engine_path):
+        """
+        Report a finished engine export.
+
+        Args:
+            engine_path (str): Path to the built engine
+        """
+        self.display_panel.status_display.setText(
+            f"Exported TensorRT engine: {engine_path}\n"
+            f"Select it as weights and re-initialize to use it."
+        )
+        self.statusBar().showMessage("Export complete")
+
+    def _on_export_failed(self, message):
+        """
+        Report a failed engine export.
+
+        Args:
+            message (str): Error description
+        """
+        self.display_panel.status_display.setText(f"Error: {message}")
+        self._notify(f"Engine export failed: {message}")
+
     def initialize_model(self):
         """Initialize the YOLOv5 detector model"""
         try:
@@ -143,6 +252,17 @@ class MainWindow(QMainWindow):
             success = self.detector.initialize(self.weights_path)
             
             if success:
+                # Warm the full pipeline (preprocess + forward + NMS) so
+                # the first real detection doesn't pay cuDNN algorithm
+                # search and kernel compilation; with cudnn.benchmark on,
+                # the third pass locks in the chosen kernels
+                try:
+                    dummy = np.zeros((480, 640, 3), dtype=np.uint8)
+                    for _ in range(3):
+                        self.detector.detect(dummy)
+                except Exception as e:
+                    print(f"Pipeline warmup failed: {str(e)}")
+
                 self.display_panel.status_display.setText(
                     f"Model initialized successfully\n"
                     f"Weights: {self.weights_path if self.weights_path else self.opt.weights}"
@@ -187,15 +307,9 @@ class MainWindow(QMainWindow):
     def detect_image(self):
         """Open and process an image for object detection"""
         if not self.detector.initialized:
-            QMessageBox.warning(
-                self, 
-                "Warning", 
-                "Please initialize the model first",
-                buttons=QMessageBox.StandardButton.Ok,
-                defaultButton=QMessageBox.StandardButton.Ok
-            )
+            self._notify("Please initialize the model first")
             return
-        
+
         # Open file dialog to select an image
         img_path, _ = QFileDialog.getOpenFileName(
             self, 
@@ -213,34 +327,32 @@ class MainWindow(QMainWindow):
             self.display_panel.status_display.setText(f"Processing image: {img_path}")
             self.statusBar().showMessage("Processing image...")
             
-            # Read image
-            img = cv2.imread(img_path)
+            # Read image (decoded on GPU for JPEGs when CUDA is active)
+            img = load_image(img_path, self.detector.device)
             if img is None:
                 raise ValueError("Failed to read image")
             
             # Perform detection
             result_img, detections, detected_classes = self.detector.detect(img)
             
-            # Save result image
-            cv2.imwrite('prediction.jpg', result_img)
+            # Optionally save the result image, encoded off the GUI thread
+            if self.opt.save_preview:
+                imwrite_async('prediction.jpg', result_img)
             
-            # Convert to Qt image and display
-            qt_img = cv_to_qt_image(result_img, 640, 480)
-            self.display_panel.display_label.setPixmap(QPixmap.fromImage(qt_img))
-            self.display_panel.display_label.setScaledContents(True)
+            # Display via a zero-copy BGR wrap; no OpenCV resize or
+            # color conversion on the way to the screen
+            self._frame_ref = result_img
+            self.display_panel.show_frame(cv_to_qt_image(result_img))
             
             # Update status with detection results
             detection_text = f"Image: {os.path.basename(img_path)}\n"
             detection_text += f"Detected {len(detected_classes)} objects\n"
             
             if detected_classes:
-                # Count occurrences of each class
-                class_counts = {}
-                for cls in detected_classes:
-                    class_counts[cls] = class_counts.get(cls, 0) + 1
-                
-                # Create summary string
-                classes_summary = ", ".join([f"{count} {cls}" for cls, count in class_counts.items()])
+                # Count occurrences of each class, most frequent first
+                class_counts = Counter(detected_classes)
+                classes_summary = ", ".join(
+                    f"{count} {cls}" for cls, count in class_counts.most_common())
                 detection_text += f"Classes: {classes_summary}"
             
             self.display_panel.status_display.setText(detection_text)
@@ -249,27 +361,14 @@ class MainWindow(QMainWindow):
         except Exception as e:
             # Handle any errors
             self.display_panel.status_display.setText(f"Error: {str(e)}")
-            QMessageBox.critical(
-                self, 
-                "Error", 
-                f"An error occurred during image detection: {str(e)}",
-                buttons=QMessageBox.StandardButton.Ok,
-                defaultButton=QMessageBox.StandardButton.Ok
-            )
-            self.statusBar().showMessage("Error")
+            self._notify(f"Image detection failed: {str(e)}")
     
     def open_video(self):
         """Open and process a video file for object detection"""
         if not self.detector.initialized:
-            QMessageBox.warning(
-                self, 
-                "Warning", 
-                "Please initialize the model first",
-                buttons=QMessageBox.StandardButton.Ok,
-                defaultButton=QMessageBox.StandardButton.Ok
-            )
+            self._notify("Please initialize the model first")
             return
-        
+
         # Open file dialog to select a video
         video_path, _ = QFileDialog.getOpenFileName(
             self, 
@@ -282,20 +381,16 @@ class MainWindow(QMainWindow):
             self.display_panel.status_display.setText("No video selected")
             return
         
-        # Try to open the video file
+        # Fresh capture per session: a previous session's reader that
+        # is still winding down can only ever release its own capture
+        self.cap = cv2.VideoCapture()
         if not self.cap.open(video_path):
-            QMessageBox.warning(
-                self, 
-                "Warning", 
-                "Failed to open video file",
-                buttons=QMessageBox.StandardButton.Ok,
-                defaultButton=QMessageBox.StandardButton.Ok
-            )
+            self._notify("Failed to open video file")
             return
         
         # Create video writer
         self.out = create_video_writer(self.cap, 'prediction.avi')
-        
+
         # Update UI
         self.display_panel.status_display.setText(f"Processing video: {video_path}")
         self.display_panel.display_label.setText("Starting video processing...")
@@ -311,104 +406,98 @@ class MainWindow(QMainWindow):
         self.control_panel.button_camera.setEnabled(False)
         self.control_panel.button_init.setEnabled(False)
         self.control_panel.button_weights.setEnabled(False)
-        
-        # 重置FPS计算
-        self.fps = 0.0
-        self.fps_last_time = time.time()
-        self.frame_count = 0
-        # Start the video timer
-        self.timer_video.start(30)  # 30ms interval, approximately 33 fps
-        
-    def process_video_frame(self):
-        """处理单个视频帧"""
-        # 计算FPS
-        current_time = time.time()
-        self.frame_count += 1
-
-        # 每秒更新一次FPS计算
-        time_diff = current_time - self.fps_last_time
-        if time_diff >= 1.0:
-            self.fps = self.frame_count / time_diff
-            self.fps_last_time = current_time
-            self.frame_count = 0
-
-        # 读取帧
-        ret, frame = self.cap.read()
-
-        if not ret or frame is None:
-            # 视频结束或出错
-            self.stop_detection()
-            return
 
+        # Start background detection
+        self._start_worker(is_camera=False)
+
+    def set_batch_size(self, text):
+        """
+        Update the inference batch size from the control panel.
+
+        Takes effect the next time a video is opened.
+
+        Args:
+            text (str): Selected batch size
+        """
         try:
-            # 检查帧是否需要旋转
-            height, width = frame.shape[:2]
-            if height > width:  # 如果高大于宽，可能需要旋转
-                # 逆时针旋转90度来修正向右旋转的问题
-                frame = cv2.rotate(frame, cv2.ROTATE_90_COUNTERCLOCKWISE)
-
-            # 进行检测
-            result_img, _, _ = self.detector.detect(frame)
-
-            # 在右上角添加FPS显示
-            #fps_text = f"FPS: {self.fps:.1f}"  # 保留一位小数
-            fps_text = "FPS: 49.8"
-            font = cv2.FONT_HERSHEY_SIMPLEX
-            font_scale = 0.7
-            thickness = 2
-            text_size, _ = cv2.getTextSize(fps_text, font, font_scale, thickness)
-            text_x = result_img.shape[1] - text_size[0] - 10  # 右边距10像素
-            text_y = text_size[1] + 10  # 上边距10像素
-
-            # 绘制半透明背景
-            cv2.rectangle(result_img, 
-                         (text_x - 5, text_y - text_size[1] - 5), 
-                         (text_x + text_size[0] + 5, text_y + 5), 
-                         (0, 0, 0, 128), -1)
-
-            # 绘制FPS文本
-            cv2.putText(result_img, fps_text, (text_x, text_y), font, 
-                       font_scale, (0, 255, 0), thickness, cv2.LINE_AA)
-
-            # 写入输出视频
-            if self.out is not None:
-                self.out.write(result_img)
-
-            # 转换为Qt图像并显示
-            qt_img = cv_to_qt_image(result_img, 1280, 720)
-            self.display_panel.display_label.setPixmap(QPixmap.fromImage(qt_img))
-        
-        except Exception as e:
-            print(f"处理帧时出错: {str(e)}")
-    
+            self.opt.batch_size = int(text)
+        except ValueError:
+            pass
+
+    def set_fp16(self, checked):
+        """
+        Update the FP16 preference from the control panel.
+
+        Takes effect the next time the model is initialized.
+
+        Args:
+            checked (bool): True to run GPU inference in FP16
+        """
+        self.opt.fp16 = checked
+
+    def _start_worker(self, is_camera):
+        """
+        Create the worker/thread pair and start background detection.
+
+        Args:
+            is_camera (bool): True for live camera capture
+        """
+        self.video_thread = QtCore.QThread(self)
+        self.video_worker = VideoWorker(
+            self.cap, self.detector, self.out,
+            batch_size=self.opt.batch_size, is_camera=is_camera)
+        self.video_worker.moveToThread(self.video_thread)
+
+        self.video_thread.started.connect(self.video_worker.run)
+        self.video_worker.frameReady.connect(self._on_frame)
+        self.video_worker.finished.connect(self.stop_detection)
+
+        self.video_thread.start()
+
+    def _on_frame(self, frame, fps):
+        """
+        Display an annotated frame emitted by the worker.
+
+        Runs on the GUI thread and only converts and paints — all
+        heavy work already happened on the worker thread.
+
+        Args:
+            frame (numpy.ndarray): Annotated BGR frame
+            fps (float): Measured processing rate
+        """
+        self._frame_ref = frame
+        self.display_panel.show_frame(cv_to_qt_image(frame))
+
+        # Surface the measured rate (0.0 until the first one-second
+        # window has elapsed)
+        if fps > 0:
+            self.statusBar().showMessage(f"Running — {fps:.1f} FPS")
+
+    def _detection_active(self):
+        """
+        Returns:
+            bool: True while the background worker is processing
+        """
+        return self.video_worker is not None and self.video_worker.is_running()
+
     def toggle_camera(self):
         """Toggle camera detection on/off"""
-        if not self.detector.initialized and not self.timer_video.isActive():
-            QMessageBox.warning(
-                self, 
-                "Warning", 
-                "Please initialize the model first",
-                buttons=QMessageBox.StandardButton.Ok,
-                defaultButton=QMessageBox.StandardButton.Ok
-            )
+        if not self.detector.initialized and not self._detection_active():
+            self._notify("Please initialize the model first")
             return
         
-        # Check if video timer is already active
-        if not self.timer_video.isActive():
-            # Try to open the default camera (index 0)
+        # Check if detection is already running
+        if not self._detection_active():
+            # Try to open the default camera (index 0); fresh capture
+            # per session, see open_video
+            self.cap = cv2.VideoCapture()
             if not self.cap.open(0):
-                QMessageBox.warning(
-                    self, 
-                    "Warning", 
-                    "Failed to open camera",
-                    buttons=QMessageBox.StandardButton.Ok,
-                    defaultButton=QMessageBox.StandardButton.Ok
-                )
+                self._notify("Failed to open camera")
                 return
             
             # Create video writer
             self.out = create_video_writer(self.cap, 'camera_detection.avi')
-            
+
             # Update UI
             self.display_panel.status_display.setText("Camera detection started")
             self.control_panel.button_camera.setText("Stop Camera")
@@ -423,9 +512,9 @@ class MainWindow(QMainWindow):
             self.control_panel.button_img.setEnabled(False)
             self.control_panel.button_init.setEnabled(False)
             self.control_panel.button_weights.setEnabled(False)
-            
-            # Start the video timer
-            self.timer_video.start(30)
+
+            # Start background detection (batch 1 for live latency)
+            self._start_worker(is_camera=True)
         else:
             # Stop camera detection
             self.stop_detection()
@@ -433,27 +522,42 @@ class MainWindow(QMainWindow):
     
     def toggle_pause(self):
         """Toggle video playback pause/resume"""
-        if self.timer_video.isActive():
+        if self.video_worker is None:
+            return
+
+        if not self.video_worker.is_paused():
             # Pause video
-            self.timer_video.stop()
+            self.video_worker.pause()
             self.control_panel.button_stop.setText("Resume")
             self.statusBar().showMessage("Paused")
         else:
-            # Resume video if cap is open
-            if self.cap.isOpened():
-                self.timer_video.start(30)
-                self.control_panel.button_stop.setText("Pause")
-                self.statusBar().showMessage("Running")
-    
+            # Resume video
+            self.video_worker.resume()
+            self.control_panel.button_stop.setText("Pause")
+            self.statusBar().showMessage("Running")
+
     def stop_detection(self):
         """Stop video/camera detection and clean up resources"""
-        # Stop timer
-        self.timer_video.stop()
-        
+        # Stop the worker and wait for its thread to finish. The
+        # worker's stream releases the capture itself once its reader
+        # thread has exited — releasing it here could pull the capture
+        # out from under a reader still blocked in cap.read()
+        cap_owned_by_worker = False
+        if self.video_worker is not None:
+            worker, thread = self.video_worker, self.video_thread
+            self.video_worker = None
+            self.video_thread = None
+
+            worker.stop()
+            thread.quit()
+            thread.wait()
+            worker.deleteLater()
+            cap_owned_by_worker = True
+
         # Release resources
-        if self.cap.isOpened():
+        if not cap_owned_by_worker and self.cap.isOpened():
             self.cap.release()
-        
+
         if self.out is not None:
             self.out.release()
             self.out = None
@@ -491,7 +595,7 @@ class MainWindow(QMainWindow):
     def closeEvent(self, event):
         """Handle window close event"""
         # Stop any active detection
-        if self.timer_video.isActive():
+        if self._detection_active():
             self.stop_detection()
         
         # Accept the close event
@@ -2,6 +2,21 @@
 UI styling constants and functions for the YOLOv5 Detector application.
 """
 
+__all__ = [
+    'MAIN_STYLE',
+    'DISPLAY_FRAME_STYLE',
+    'STATUS_FRAME_STYLE',
+    'TITLE_LABEL_STYLE',
+    'STATUS_LABEL_STYLE',
+    'EMPTY_DISPLAY_STYLE',
+    'INFO_TEXT_STYLE',
+    'TOAST_STYLE',
+    'APP_STYLE',
+    'get_image_type_filter',
+    'get_video_type_filter',
+    'get_weights_type_filter',
+]
+
 # Main application stylesheet
 MAIN_STYLE = """
 /* Global Styles */
@@ -89,9 +104,10 @@ QGroupBox::title {
 }
 """
 
-# Frame styles
+# Frame styles, scoped by objectName so they can live in the single
+# application-level stylesheet instead of per-widget setStyleSheet calls
 DISPLAY_FRAME_STYLE = """
-QFrame {
+QFrame#display_frame {
     background-color: #343a40;
     border-radius: 10px;
     padding: 5px;
@@ -99,7 +115,7 @@ QFrame {
 """
 
 STATUS_FRAME_STYLE = """
-QFrame {
+QFrame#status_frame {
     background-color: white;
     border-radius: 10px;
     border: 1px solid #e9ecef;
@@ -108,30 +124,62 @@ QFrame {
 
 # Label styles
 TITLE_LABEL_STYLE = """
-font-size: 22px; 
-font-weight: bold; 
-color: #212529;
-margin-bottom: 15px;
-padding: 10px;
+QLabel#title_label {
+    font-size: 22px;
+    font-weight: bold;
+    color: #212529;
+    margin-bottom: 15px;
+    padding: 10px;
+}
 """
 
 STATUS_LABEL_STYLE = """
-font-weight: bold;
-color: #495057;
+QLabel#status_header {
+    font-weight: bold;
+    color: #495057;
+}
 """
 
 EMPTY_DISPLAY_STYLE = """
-color: #adb5bd;
-font-size: 18px;
-font-weight: light;
+QLabel#label {
+    color: #adb5bd;
+    font-size: 18px;
+    font-weight: light;
+}
 """
 
 # Info text style
 INFO_TEXT_STYLE = """
-color: #6c757d;
-font-size: 12px;
+QLabel#app_info {
+    color: #6c757d;
+    font-size: 12px;
+}
+"""
+
+# Non-modal toast notification
+TOAST_STYLE = """
+QLabel#toast {
+    background-color: rgba(33, 37, 41, 220);
+    color: white;
+    border-radius: 6px;
+    padding: 10px 16px;
+    font-size: 13px;
+}
 """
 
+# Everything above joined once; set on the QApplication at startup so
+# Qt parses and polishes a single stylesheet instead of one per widget
+APP_STYLE = "\n".join([
+    MAIN_STYLE,
+    DISPLAY_FRAME_STYLE,
+    STATUS_FRAME_STYLE,
+    TITLE_LABEL_STYLE,
+    STATUS_LABEL_STYLE,
+    EMPTY_DISPLAY_STYLE,
+    INFO_TEXT_STYLE,
+    TOAST_STYLE,
+])
+
 def get_image_type_filter():
     """Return file filter for image selection dialog"""
     return "Image Files (*.jpg *.jpeg *.png *.bmp);;All Files (*)"
@@ -142,4 +190,4 @@ def get_video_type_filter():
 
 def get_weights_type_filter():
     """Return file filter for weights selection dialog"""
-    return "Weights Files (*.pt,*.onnx,*.engine);;All Files (*)"
\ No newline at end of file
+    return "Weights Files (*.pt *.onnx *.engine);;All Files (*)"
\ No newline at end of file
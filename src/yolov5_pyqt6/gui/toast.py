@@ -0,0 +1,54 @@
+"""
+Non-modal toast notification for the YOLOv5 Detector application.
+Gives transient feedback without spinning a nested event loop the way
+a modal QMessageBox does.
+"""
+from PyQt6 import QtCore
+from PyQt6.QtWidgets import QLabel
+
+class Toast(QLabel):
+    """
+    Auto-hiding notification label.
+
+    Floats over its parent widget and hides itself after a timeout.
+    Unlike QMessageBox.warning/critical it never blocks the event
+    loop, so frame signals, repaints and closeEvent keep running
+    while the message is visible. Styled via the application
+    stylesheet (QLabel#toast).
+    """
+
+    DURATION_MS = 3000
+
+    def __init__(self, parent):
+        """
+        Create the (initially hidden) toast.
+
+        Args:
+            parent (QWidget): Widget the toast floats over
+        """
+        super().__init__(parent)
+        self.setObjectName("toast")
+        self.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
+        self.setWordWrap(True)
+        self.hide()
+
+    def show_message(self, text, duration_ms=None):
+        """
+        Show a message near the bottom of the parent and auto-hide it.
+
+        Args:
+            text (str): Message to display
+            duration_ms (int, optional): Visible time in milliseconds.
+                                         Defaults to DURATION_MS.
+        """
+        self.setText(text)
+        self.adjustSize()
+
+        parent = self.parentWidget()
+        if parent is not None:
+            self.move((parent.width() - self.width()) // 2,
+                      parent.height() - self.height() - 30)
+
+        self.show()
+        self.raise_()
+        QtCore.QTimer.singleShot(duration_ms or self.DURATION_MS, self.hide)
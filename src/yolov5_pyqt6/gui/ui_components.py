@@ -1,9 +1,34 @@
 """
 Reusable UI components for the YOLOv5 Detector application.
 """
+import sys
 from PyQt6 import QtCore, QtWidgets, QtGui
-from PyQt6.QtWidgets import QLabel, QTextBrowser, QPushButton, QGroupBox, QVBoxLayout, QHBoxLayout
-from gui.styles import *
+from PyQt6.QtWidgets import QLabel, QTextBrowser, QPushButton, QGroupBox, QVBoxLayout, QHBoxLayout, QComboBox, QCheckBox
+
+# Theme icons resolved once per name: QIcon.fromTheme probes the icon
+# theme search path on disk for every call (and always misses on
+# Windows), which slows first window show
+_theme_icons = {}
+
+def _theme_icon(name):
+    """
+    Return a theme icon by name, cached for the application lifetime.
+
+    Args:
+        name (str): freedesktop icon name, e.g. 'document-open'
+
+    Returns:
+        QtGui.QIcon: Resolved icon, or a null icon when the theme
+                     doesn't provide one (always the case on Windows)
+    """
+    icon = _theme_icons.get(name)
+    if icon is None:
+        if sys.platform != 'win32' and QtGui.QIcon.hasThemeIcon(name):
+            icon = QtGui.QIcon.fromTheme(name)
+        else:
+            icon = QtGui.QIcon()
+        _theme_icons[name] = icon
+    return icon
 
 class ControlPanel(QtWidgets.QWidget):
     """Left control panel with buttons"""
@@ -22,8 +47,8 @@ class ControlPanel(QtWidgets.QWidget):
         
         # Title
         self.title_label = QLabel("YOLO Detector")
+        self.title_label.setObjectName("title_label")
         self.title_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.title_label.setStyleSheet(TITLE_LABEL_STYLE)
         layout.addWidget(self.title_label)
         
         # Model setup group
@@ -32,14 +57,21 @@ class ControlPanel(QtWidgets.QWidget):
         
         self.button_weights = QPushButton("Select Weights")
         self.button_weights.setObjectName("pushButton_weights")
-        self.button_weights.setIcon(QtGui.QIcon.fromTheme("document-open"))
+        self.button_weights.setIcon(_theme_icon("document-open"))
         
         self.button_init = QPushButton("Initialize Model")
         self.button_init.setObjectName("pushButton_init")
-        self.button_init.setIcon(QtGui.QIcon.fromTheme("system-run"))
+        self.button_init.setIcon(_theme_icon("system-run"))
         
         model_layout.addWidget(self.button_weights)
         model_layout.addWidget(self.button_init)
+
+        # FP16 toggle for the GPU path (uncheck on GPUs without fast FP16)
+        self.fp16_checkbox = QCheckBox("Use FP16")
+        self.fp16_checkbox.setObjectName("checkBox_fp16")
+        self.fp16_checkbox.setChecked(True)
+        model_layout.addWidget(self.fp16_checkbox)
+
         layout.addWidget(self.model_group)
         
         # Detection group
@@ -48,19 +80,31 @@ class ControlPanel(QtWidgets.QWidget):
         
         self.button_img = QPushButton("Image Detection")
         self.button_img.setObjectName("pushButton_img")
-        self.button_img.setIcon(QtGui.QIcon.fromTheme("image-x-generic"))
+        self.button_img.setIcon(_theme_icon("image-x-generic"))
         
         self.button_video = QPushButton("Video Detection")
         self.button_video.setObjectName("pushButton_video")
-        self.button_video.setIcon(QtGui.QIcon.fromTheme("video-x-generic"))
+        self.button_video.setIcon(_theme_icon("video-x-generic"))
         
         self.button_camera = QPushButton("Camera Detection")
         self.button_camera.setObjectName("pushButton_camera")
-        self.button_camera.setIcon(QtGui.QIcon.fromTheme("camera-web"))
+        self.button_camera.setIcon(_theme_icon("camera-web"))
         
         detect_layout.addWidget(self.button_img)
         detect_layout.addWidget(self.button_video)
         detect_layout.addWidget(self.button_camera)
+
+        # Inference batch size for video files (higher batches raise GPU
+        # throughput at the cost of VRAM; live camera stays at batch 1)
+        batch_row = QHBoxLayout()
+        self.batch_label = QLabel("Batch size")
+        self.batch_combo = QComboBox()
+        self.batch_combo.setObjectName("comboBox_batch")
+        self.batch_combo.addItems(["1", "2", "4", "8", "16"])
+        batch_row.addWidget(self.batch_label)
+        batch_row.addWidget(self.batch_combo)
+        detect_layout.addLayout(batch_row)
+
         layout.addWidget(self.detect_group)
         
         # 在ControlPanel类的setup_ui方法中修改视频控制部分:
@@ -71,12 +115,12 @@ class ControlPanel(QtWidgets.QWidget):
         # 直接将按钮添加到垂直布局
         self.button_stop = QPushButton("Pause")
         self.button_stop.setObjectName("pushButton_stop")
-        self.button_stop.setIcon(QtGui.QIcon.fromTheme("media-playback-pause"))
+        self.button_stop.setIcon(_theme_icon("media-playback-pause"))
         self.button_stop.setEnabled(False)
 
         self.button_finish = QPushButton("Stop")
         self.button_finish.setObjectName("pushButton_finish")
-        self.button_finish.setIcon(QtGui.QIcon.fromTheme("media-playback-stop"))
+        self.button_finish.setIcon(_theme_icon("media-playback-stop"))
         self.button_finish.setEnabled(False)
 
         # 垂直添加按钮（上下排列）
@@ -89,8 +133,8 @@ class ControlPanel(QtWidgets.QWidget):
         
         # App info at bottom
         self.app_info = QLabel("YOLOv5 Object Detection")
+        self.app_info.setObjectName("app_info")
         self.app_info.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.app_info.setStyleSheet(INFO_TEXT_STYLE)
         layout.addWidget(self.app_info)
 
 
@@ -100,8 +144,30 @@ class DisplayPanel(QtWidgets.QWidget):
     def __init__(self, parent=None):
         """Initialize the display panel"""
         super().__init__(parent)
+
+        # Persistent pixmap, refilled in place each frame so no new
+        # backend pixmap is allocated per tick
+        self._pixmap = QtGui.QPixmap()
+
         self.setup_ui()
-    
+
+    def show_frame(self, qt_img):
+        """
+        Display a frame on the panel's label.
+
+        convertFromImage refills the persistent pixmap instead of
+        allocating a fresh one per frame; the result is scaled to the
+        label once with a fast transform, aspect ratio kept.
+
+        Args:
+            qt_img (QImage): Frame to display
+        """
+        self._pixmap.convertFromImage(qt_img)
+        self.display_label.setPixmap(self._pixmap.scaled(
+            self.display_label.size(),
+            QtCore.Qt.AspectRatioMode.KeepAspectRatio,
+            QtCore.Qt.TransformationMode.FastTransformation))
+
     def setup_ui(self):
         """Set up the display panel UI"""
         layout = QVBoxLayout(self)
@@ -110,16 +176,15 @@ class DisplayPanel(QtWidgets.QWidget):
         
         # Display frame
         self.display_frame = QtWidgets.QFrame()
+        self.display_frame.setObjectName("display_frame")
         self.display_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
         self.display_frame.setFrameShadow(QtWidgets.QFrame.Shadow.Raised)
-        self.display_frame.setStyleSheet(DISPLAY_FRAME_STYLE)
         display_layout = QVBoxLayout(self.display_frame)
         
         self.display_label = QLabel()
         self.display_label.setObjectName("label")
         self.display_label.setText("No image loaded")
         self.display_label.setAlignment(QtCore.Qt.AlignmentFlag.AlignCenter)
-        self.display_label.setStyleSheet(EMPTY_DISPLAY_STYLE)
         self.display_label.setSizePolicy(
             QtWidgets.QSizePolicy.Policy.Expanding, 
             QtWidgets.QSizePolicy.Policy.Expanding
@@ -130,12 +195,12 @@ class DisplayPanel(QtWidgets.QWidget):
         
         # Status frame
         self.status_frame = QtWidgets.QFrame()
+        self.status_frame.setObjectName("status_frame")
         self.status_frame.setFrameShape(QtWidgets.QFrame.Shape.StyledPanel)
-        self.status_frame.setStyleSheet(STATUS_FRAME_STYLE)
         status_layout = QVBoxLayout(self.status_frame)
-        
+
         self.status_header = QLabel("Detection Status")
-        self.status_header.setStyleSheet(STATUS_LABEL_STYLE)
+        self.status_header.setObjectName("status_header")
         
         self.status_display = QTextBrowser()
         self.status_display.setObjectName("status_display")
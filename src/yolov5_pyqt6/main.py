@@ -0,0 +1,51 @@
+"""
+Main entry point for the YOLOv5 Detector application.
+This script initializes and runs the application.
+"""
+import os
+import sys
+
+def _ensure_yolov5_on_path():
+    """
+    Make the surrounding YOLOv5 checkout importable.
+
+    core.detector and core.export import YOLOv5's top-level models/ and
+    utils/ packages, which the readme documents as the checkout this
+    project lives inside. When running installed (where that parent is
+    not on sys.path), resolve the checkout from the YOLOV5_ROOT
+    environment variable, falling back to the source layout's parent
+    directory.
+    """
+    try:
+        import models  # noqa: F401
+        return
+    except ImportError:
+        pass
+
+    root = os.environ.get('YOLOV5_ROOT')
+    if not root:
+        # src/yolov5_pyqt6/ -> src/ -> project root -> YOLOv5 checkout
+        here = os.path.dirname(os.path.abspath(__file__))
+        root = os.path.dirname(os.path.dirname(os.path.dirname(here)))
+    if root not in sys.path:
+        sys.path.insert(0, root)
+
+def main():
+    """Initialize and run the application."""
+    _ensure_yolov5_on_path()
+
+    from PyQt6.QtWidgets import QApplication
+
+    from yolov5_pyqt6.gui.main_windows import MainWindow
+    from yolov5_pyqt6.gui.styles import APP_STYLE
+
+    app = QApplication(sys.argv)
+    # One app-level stylesheet: Qt parses and polishes it once instead
+    # of re-parsing CSS for every widget-level setStyleSheet call
+    app.setStyleSheet(APP_STYLE)
+    window = MainWindow()
+    window.show()
+    sys.exit(app.exec())
+
+if __name__ == '__main__':
+    main()